@@ -14,6 +14,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("micro_consultas")
 
 VALID_TOKEN = "secreto123"
+# Cabecera esperada y rutas sin autenticación, calculadas una sola vez al arrancar
+AUTH_ESPERADA = f"Bearer {VALID_TOKEN}"
+RUTAS_PUBLICAS = ("/token", "/docs", "/openapi.json")
 
 class Pregunta(BaseModel):
     pregunta: str
@@ -27,12 +30,10 @@ class Pregunta(BaseModel):
 
 @app.middleware("http")
 async def validar_token(request: Request, call_next):
-    rutas_publicas = ["/token", "/docs", "/openapi.json"]
-    if any(request.url.path.startswith(r) for r in rutas_publicas):
+    if request.url.path.startswith(RUTAS_PUBLICAS):
         return await call_next(request)
 
-    auth = request.headers.get("Authorization")
-    if not auth or auth != f"Bearer {VALID_TOKEN}":
+    if request.headers.get("Authorization") != AUTH_ESPERADA:
         raise HTTPException(status_code=401, detail="Token inválido o no proporcionado")
 
     return await call_next(request)
@@ -45,7 +46,7 @@ async def responder(pregunta: Pregunta):
     **Requiere token válido**
     """
     texto = pregunta.pregunta.lower()
-    logger.info(f"[CONSULTAS] Recibida pregunta: {texto}")
+    logger.info("[CONSULTAS] Recibida pregunta: %s", texto)
 
     if any(p in texto for p in ["movimiento", "compra", "comprado", "últimamente"]):
         return {"respuesta": "Tu último movimiento fue una compra de 35€ en Amazon."}
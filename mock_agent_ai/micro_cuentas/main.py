@@ -15,6 +15,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("micro_cuentas")
 
 VALID_TOKEN = "secreto123"
+# Cabecera esperada y rutas sin autenticación, calculadas una sola vez al arrancar
+AUTH_ESPERADA = f"Bearer {VALID_TOKEN}"
+RUTAS_PUBLICAS = ("/token", "/docs", "/openapi.json")
 
 
 class Pregunta(BaseModel):
@@ -40,12 +43,10 @@ def _normalize(text: str) -> str:
 
 @app.middleware("http")
 async def validar_token(request: Request, call_next):
-    rutas_publicas = ["/token", "/docs", "/openapi.json"]
-    if any(request.url.path.startswith(r) for r in rutas_publicas):
+    if request.url.path.startswith(RUTAS_PUBLICAS):
         return await call_next(request)
 
-    auth = request.headers.get("Authorization")
-    if not auth or auth != f"Bearer {VALID_TOKEN}":
+    if request.headers.get("Authorization") != AUTH_ESPERADA:
         raise HTTPException(status_code=401, detail="Token inválido o no proporcionado")
 
     return await call_next(request)
@@ -67,7 +68,7 @@ async def responder(pregunta: Pregunta):
     """
     texto_orig = pregunta.pregunta
     texto = _normalize(texto_orig)
-    logger.info(f"[CUENTAS] Pregunta recibida: {texto_orig!r} → normalizado: {texto!r}")
+    logger.info("[CUENTAS] Pregunta recibida: %r → normalizado: %r", texto_orig, texto)
 
     # 1) Apertura de cuenta (cualquier variante con 'abrir' y 'cuenta')
     if "IBAN" in texto and "cuenta" in texto:
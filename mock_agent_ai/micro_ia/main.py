@@ -14,6 +14,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("micro_ia")
 
 VALID_TOKEN = "secreto123"
+# Cabecera esperada y rutas sin autenticación, calculadas una sola vez al arrancar
+AUTH_ESPERADA = f"Bearer {VALID_TOKEN}"
+RUTAS_PUBLICAS = ("/token", "/docs", "/openapi.json")
 
 class Pregunta(BaseModel):
     pregunta: str
@@ -39,12 +42,10 @@ RESPUESTAS_IA = {
 
 @app.middleware("http")
 async def validar_token(request: Request, call_next):
-    rutas_publicas = ["/token", "/docs", "/openapi.json"]
-    if any(request.url.path.startswith(r) for r in rutas_publicas):
+    if request.url.path.startswith(RUTAS_PUBLICAS):
         return await call_next(request)
 
-    auth = request.headers.get("Authorization")
-    if not auth or auth != f"Bearer {VALID_TOKEN}":
+    if request.headers.get("Authorization") != AUTH_ESPERADA:
         raise HTTPException(status_code=401, detail="Token inválido o no proporcionado")
 
     return await call_next(request)
@@ -67,7 +68,7 @@ async def responder(pregunta: Pregunta):
     Si no se encuentra ninguna coincidencia, responde con un mensaje genérico.
     """
     texto = pregunta.pregunta.lower()
-    logger.info(f"[IA] Pregunta recibida: {texto}")
+    logger.info("[IA] Pregunta recibida: %s", texto)
 
     for clave, respuesta in RESPUESTAS_IA.items():
         if clave in texto:
@@ -1,16 +1,39 @@
 # mock-agent-AI/orquestador/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import httpx
 import os
+import re
 import logging
 
+# Token simulado
+VALID_TOKEN = "secreto123"
+# Cabecera esperada y rutas sin autenticación, calculadas una sola vez al arrancar
+AUTH_ESPERADA = f"Bearer {VALID_TOKEN}"
+RUTAS_PUBLICAS = ("/token", "/docs", "/openapi.json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Abre un único cliente HTTP compartido para reenviar las consultas a los micros,
+    reutilizando conexiones entre peticiones, y lo cierra al apagar el servicio.
+    """
+    app.state.http_client = httpx.AsyncClient(
+        headers={"Authorization": AUTH_ESPERADA}
+    )
+    yield
+    await app.state.http_client.aclose()
+
+
 app = FastAPI(
     title="🧠 Orquestador del Agente IA Bancario",
     description="Servicio que enruta preguntas bancarias a los microservicios adecuados: consultas, cuentas, identidad e inteligencia artificial.",
     version="1.0.1",
+    lifespan=lifespan,
 )
 
 # Configuración de logging
@@ -20,8 +43,29 @@ logger = logging.getLogger("orquestador")
 # Endpoints de los micros (por orden esperado: consultas, cuentas, identidad, IA)
 MICROS = os.getenv("MICROS_ENDPOINTS", "").split(",")
 
-# Token simulado
-VALID_TOKEN = "secreto123"
+
+def _compilar_palabras(palabras):
+    """
+    Compila una lista de palabras clave en una única alternancia,
+    de modo que cada pregunta se recorre una sola vez por micro.
+    """
+    return re.compile("|".join(re.escape(p) for p in palabras))
+
+
+# Palabras clave de enrutado, con sinónimos y frases comunes (compiladas una vez al arrancar)
+PATRON_CONSULTAS = _compilar_palabras([
+    "movimiento", "saldo", "extracto", "recibo", "luz", "agua", "internet",
+    "iban", "cajero", "oficina", "ingreso", "tarjeta", "límite",
+    "divisa", "cambio", "seguridad", "acceso", "comprado", "compra", "últimamente"
+])
+PATRON_CUENTAS = _compilar_palabras([
+    "abrir cuenta", "cuenta nueva", "tipo de cuenta", "tipos de cuenta",
+    "requisito", "documentación", "comisión", "cambiar cuenta", "convertir cuenta", "plazo", "tiempo"
+])
+PATRON_IDENTIDAD = _compilar_palabras([
+    "dni", "nie", "sms", "código", "correo", "email", "2fa",
+    "verificar identidad", "autenticación", "doble factor", "identidad"
+])
 
 class Consulta(BaseModel):
     pregunta: str
@@ -42,12 +86,10 @@ async def obtener_token():
 
 @app.middleware("http")
 async def validar_token(request: Request, call_next):
-    rutas_publicas = ["/token", "/docs", "/openapi.json"]
-    if any(request.url.path.startswith(r) for r in rutas_publicas):
+    if request.url.path.startswith(RUTAS_PUBLICAS):
         return await call_next(request)
 
-    auth = request.headers.get("Authorization")
-    if not auth or auth != f"Bearer {VALID_TOKEN}":
+    if request.headers.get("Authorization") != AUTH_ESPERADA:
         raise HTTPException(status_code=401, detail="Token inválido o no proporcionado")
 
     return await call_next(request)
@@ -65,40 +107,29 @@ async def procesar_consulta(consulta: Consulta):
     - 🤖 IA: cualquier otra pregunta general
     """
     texto = consulta.pregunta.lower()
-    logger.info(f"Pregunta recibida: {texto}")
-
-    # Añadimos sinónimos y frases comunes para mejorar el enrutado
-    if any(palabra in texto for palabra in [
-        "movimiento", "saldo", "extracto", "recibo", "luz", "agua", "internet",
-        "iban", "cajero", "oficina", "ingreso", "tarjeta", "límite",
-        "divisa", "cambio", "seguridad", "acceso", "comprado", "compra", "últimamente"
-    ]):
+    logger.info("Pregunta recibida: %s", texto)
+
+    if PATRON_CONSULTAS.search(texto):
         micro_url = MICROS[0]  # micro_consultas
-    elif any(palabra in texto for palabra in [
-        "abrir cuenta", "cuenta nueva", "tipo de cuenta", "tipos de cuenta",
-        "requisito", "documentación", "comisión", "cambiar cuenta", "convertir cuenta", "plazo", "tiempo"
-    ]):
+    elif PATRON_CUENTAS.search(texto):
         micro_url = MICROS[1]  # micro_cuentas
-    elif any(palabra in texto for palabra in [
-        "dni", "nie", "sms", "código", "correo", "email", "2fa",
-        "verificar identidad", "autenticación", "doble factor", "identidad"
-    ]):
+    elif PATRON_IDENTIDAD.search(texto):
         micro_url = MICROS[2]  # micro_identidad
     else:
         micro_url = MICROS[3]  # micro_ia
 
-    logger.info(f"Reenviando consulta a: {micro_url}/respuesta")
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{micro_url}/respuesta",
-                json={"pregunta": texto},
-                headers={"Authorization": f"Bearer {VALID_TOKEN}"}
-            )
-            response.raise_for_status()
-        except Exception as e:
-            logger.error(f"Error al comunicar con {micro_url}: {e}")
-            raise HTTPException(status_code=502, detail="Error al contactar con microservicio")
+    logger.info("Reenviando consulta a: %s/respuesta", micro_url)
+
+    # Fuera del try: si el lifespan no ha arrancado, debe fallar a la vista y no como 502
+    client = app.state.http_client
+    try:
+        response = await client.post(
+            f"{micro_url}/respuesta",
+            json={"pregunta": texto},
+        )
+        response.raise_for_status()
+    except Exception as e:
+        logger.error("Error al comunicar con %s: %s", micro_url, e)
+        raise HTTPException(status_code=502, detail="Error al contactar con microservicio")
 
     return {"respuesta": response.json().get("respuesta", "Sin respuesta")}
@@ -39,6 +39,18 @@ MICROS = {
 }
 
 
+def _es_controlador_xdist(config):
+    """True en el proceso que reparte los tests entre workers de xdist (él no ejecuta ninguno)."""
+    return not hasattr(config, "workerinput") and bool(getattr(config.option, "numprocesses", 0))
+
+
+def pytest_configure(config):
+    # Configura loguru solo en los procesos que ejecutan tests (cada worker de xdist,
+    # o el proceso único sin -n); el controlador no crea fichero de log
+    if not _es_controlador_xdist(config):
+        log_config.configure()
+
+
 @pytest.fixture(scope="session")
 def api_client():
     client = httpx.Client()
@@ -46,6 +58,19 @@ def api_client():
     client.close()
 
 
+@pytest.fixture(scope="session")
+def client():
+    """
+    TestClient del orquestador, compartido por toda la sesión (uno por worker de xdist).
+    Arranca el lifespan de la app una sola vez y reutiliza su transporte entre tests.
+    """
+    from fastapi.testclient import TestClient
+    from mock_agent_ai.orquestador.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
 @pytest.fixture
 def record_api_call(api_client):
     def _call(method: str, path: str, **kwargs):
@@ -122,15 +147,22 @@ def log_test_info(request):
 
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
+    # Cada worker adjunta su propio log; el controlador no tiene nada que aportar
+    if _es_controlador_xdist(session.config):
+        return
     try:
-        from log_config import get_log_file
-        log_path = get_log_file()
+        from log_config import get_log_file, get_error_log_file
+        logger.complete()  # Vacía la cola de los sinks con enqueue=True antes de copiar
         allure_dir = os.getenv("ALLURE_RESULTS_DIR", "reports/unit_results")
         os.makedirs(allure_dir, exist_ok=True)
-        dest_path = os.path.join(allure_dir, os.path.basename(log_path))
 
-        shutil.copy(log_path, dest_path)
-        logger.info(f"[log] 📝 Log adjuntado a Allure: {dest_path}")
+        # El log de errores (con las trazas completas) solo existe si hubo algún ERROR
+        for log_path in (get_log_file(), get_error_log_file()):
+            if not os.path.exists(log_path):
+                continue
+            dest_path = os.path.join(allure_dir, os.path.basename(log_path))
+            shutil.copy(log_path, dest_path)
+            logger.info(f"[log] 📝 Log adjuntado a Allure: {dest_path}")
     except Exception as e:
         # No usamos logger aquí por si el sink ya está cerrado
         print(f"[log] ❌ Error al copiar log a Allure: {e}")
@@ -2,14 +2,30 @@
 
 import os
 import requests
+from types import SimpleNamespace
+from requests.adapters import HTTPAdapter
+
+def _escribir_si_cambia(path, data):
+    """Escribe los bytes de una sola vez, salvo que el fichero ya tenga ese mismo contenido."""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    with open(path, "wb", buffering=0) as f:
+        f.write(data)
+
 
 def before_all(context):
     """
     Se ejecuta antes de cualquier escenario:
+    - Abre una sesión HTTP compartida (keep-alive y pool de conexiones).
     - Configura los endpoints de los micros.
-    - Obtiene un token válido.
     - Genera environment.properties para Allure.
     """
+    # 0. Sesión HTTP compartida por todos los steps
+    context.http = requests.Session()
+    context.http.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
     # 1. Endpoints
     context.base_urls = {
         "orquestador": "http://localhost:8000",
@@ -18,16 +34,16 @@ def before_all(context):
         "identidad":   "http://localhost:8003",
         "ia":          "http://localhost:8004",
     }
+    context.micros = SimpleNamespace(**context.base_urls)
 
-    # 2. Obtener token
-    resp = requests.post(f"{context.base_urls['orquestador']}/token")
-    resp.raise_for_status()
-    context.token = resp.json().get("access_token")
-
-    # 3. Generar environment.properties para Allure
+    # 2. Generar environment.properties para Allure
     results_dir = "reports/behave_results"
     os.makedirs(results_dir, exist_ok=True)
-    props = "\n".join(f"{name.upper()}={url}"
-                      for name, url in context.base_urls.items())
-    with open(os.path.join(results_dir, "environment.properties"), "w") as f:
-        f.write(props)
+    props = b"\n".join(f"{name.upper()}={url}".encode()
+                       for name, url in context.base_urls.items())
+    _escribir_si_cambia(os.path.join(results_dir, "environment.properties"), props)
+
+
+def after_all(context):
+    """Cierra la sesión HTTP compartida."""
+    context.http.close()
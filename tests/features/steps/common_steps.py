@@ -1,49 +1,50 @@
 # tests/features/steps/common_steps.py
 
 import json
-import requests
 from behave import step, step, step, step
 
-# Si prefieres, puedes leer estas URLs de environment.py en lugar de hard-codearlas
-MICROS = {
-    "orquestador": "http://localhost:8000",
-    "consultas": "http://localhost:8001",
-    "cuentas": "http://localhost:8002",
-    "identidad": "http://localhost:8003",
-    "ia": "http://localhost:8004",
-}
+# Cuerpos JSON ya serializados por pregunta (los Scenario Outline repiten muchas)
+_PAYLOADS = {}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _obtener_token(context):
+    """Pide el token al orquestador solo si la sesión HTTP aún no lleva Authorization."""
+    if "Authorization" not in context.http.headers:
+        resp = context.http.post(f"{context.micros.orquestador}/token")
+        resp.raise_for_status()
+        context.http.headers.update({"Authorization": f"Bearer {resp.json()['access_token']}"})
+    return context.http.headers["Authorization"].removeprefix("Bearer ")
 
 
 @step('que tengo un token válido')
 def step_impl_token(context):
-    """Obtiene el token una sola vez y lo guarda en context.token."""
-    resp = requests.post(f"{MICROS['orquestador']}/token")
-    resp.raise_for_status()
-    context.token = resp.json()['access_token']
+    """Obtiene el token una sola vez y lo guarda en context.token y en la sesión HTTP."""
+    context.token = _obtener_token(context)
 
 
 @step('la URL del micro "{micro}"')
 def step_impl_set_base_url(context, micro):
-    """Carga la URL base del micro en context.base_url."""
-    context.base_url = MICROS[micro]
+    """Carga la URL base del micro (definida en environment.py) en context.base_url."""
+    context.base_url = getattr(context.micros, micro)
 
 
 @step('envío una petición POST a "{endpoint}" sin payload')
 def step_impl_post_no_payload(context, endpoint):
     """POST al endpoint sin cuerpo (para /token)."""
     url = f"{context.base_url}{endpoint}"
-    context.response = requests.post(url)
+    context.response = context.http.post(url)
 
 
 @step('envío una petición POST a "{endpoint}" con pregunta "{pregunta}"')
 def step_impl_post_with_pregunta(context, endpoint, pregunta):
-    """POST al endpoint con JSON {"pregunta": ...} y Authorization."""
+    """POST al endpoint con JSON {"pregunta": ...}; la sesión ya lleva el Authorization."""
+    _obtener_token(context)
     url = f"{context.base_url}{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {context.token}",
-        "Content-Type": "application/json"
-    }
-    context.response = requests.post(url, headers=headers, json={"pregunta": pregunta})
+    body = _PAYLOADS.get(pregunta)
+    if body is None:
+        body = _PAYLOADS[pregunta] = json.dumps({"pregunta": pregunta}).encode("utf-8")
+    context.response = context.http.post(url, data=body, headers=_JSON_HEADERS)
 
 
 @step("el código de respuesta debe ser {status_code:d}")
@@ -52,22 +53,35 @@ def step_impl_status_code(context, status_code):
     assert actual == status_code, f"Se esperaba status {status_code}, pero fue {actual}"
 
 
+def _cuerpo_busqueda(response):
+    """
+    Devuelve (JSON o None, texto crudo, texto en minúsculas donde buscar) para la respuesta.
+    Se calcula una sola vez por respuesta y se reutiliza en cada comprobación.
+    """
+    cache = getattr(response, "_cuerpo_busqueda", None)
+    if cache is None:
+        raw = response.text  # se decodifica una única vez
+        try:
+            body = json.loads(raw)
+            texto = json.dumps(body, ensure_ascii=False)
+        except ValueError:
+            body, texto = None, raw
+        cache = (body, raw, texto.lower())
+        response._cuerpo_busqueda = cache
+    return cache
+
+
 @step('la respuesta debe contener "{fragmento}"')
 def step_impl_body_contains(context, fragmento):
     """
     Comprueba que el fragmento aparezca, sea en el JSON (cualquier campo/clave)
     o en el texto plano de la respuesta. No distingue mayúsculas.
     """
-    fragmento_lower = fragmento.lower()
-
-    try:
-        body = context.response.json()
-        hay = fragmento_lower in json.dumps(body, ensure_ascii=False).lower()
-    except ValueError:
-        hay = fragmento_lower in context.response.text.lower()
+    body, raw, texto = _cuerpo_busqueda(context.response)
+    hay = fragmento.lower() in texto
 
     assert hay, (
         f"Se esperaba '{fragmento}' en la respuesta.\n"
-        f"--> texto/raw: {context.response.text!r}\n"
+        f"--> texto/raw: {raw!r}\n"
         f"--> JSON:     {getattr(body, 'keys', lambda: None)()}"
     )
@@ -1,41 +1,77 @@
 # tests/log_config.py
 
 from loguru import logger
+import functools
 import os
 import sys
 from datetime import datetime
 
 # 📁 Directorio donde guardar los logs
 LOGS_DIR = os.path.join(os.path.dirname(__file__), "logs")
-os.makedirs(LOGS_DIR, exist_ok=True)
-
-# 🕒 Timestamp único por ejecución (fecha y hora hasta segundos)
-timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-LOG_FILE_PATH = os.path.join(LOGS_DIR, f"tests_{timestamp}.log")
-
-# 🔁 Configuración de loguru
-logger.remove()  # Elimina el handler por defecto (stdout)
-
-# ➕ Salida a consola (colorida, info a partir de INFO)
-logger.add(
-    sys.stdout,
-    level="INFO",
-    format="<green>[{time:HH:mm:ss}]</green> <level>[{level}]</level> <cyan>{message}</cyan>"
-)
-
-# 🧾 Salida a fichero (detallada, incluye DEBUG y trazas)
-logger.add(
-    LOG_FILE_PATH,
-    level="DEBUG",
-    rotation="1 day",  # Rota cada día
-    retention="7 days",  # Mantiene logs por 7 días
-    compression="zip",  # Comprime logs antiguos
-    format="[{time:YYYY-MM-DD HH:mm:ss}] [{level}] {message}",
-    backtrace=True,  # Añade traceback si hay excepciones
-    diagnose=True  # Información útil de errores complejos
-)
+
+
+def _ruta_errores(log_file_path):
+    """Ruta del log de errores asociado (solo se toca la extensión, no el resto de la ruta)."""
+    return os.path.splitext(log_file_path)[0] + "_errores.log"
+
+
+# 🔁 Configuración de loguru (no al importar: la invoca conftest en cada proceso que ejecuta tests)
+@functools.lru_cache(maxsize=1)
+def configure():
+    """
+    Configura los handlers de loguru una única vez por proceso y devuelve
+    la ruta del fichero de log de esta ejecución.
+    """
+    os.makedirs(LOGS_DIR, exist_ok=True)
+
+    # 🕒 Timestamp por ejecución (hasta segundos) + worker de xdist, para que
+    # los procesos que arrancan en el mismo segundo no compartan fichero
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    log_file_path = os.path.join(LOGS_DIR, f"tests_{timestamp}_{worker}.log")
+
+    logger.remove()  # Elimina el handler por defecto (stdout)
+
+    # ➕ Salida a consola (colorida, info a partir de INFO)
+    logger.add(
+        sys.stdout,
+        level="INFO",
+        format="<green>[{time:HH:mm:ss}]</green> <level>[{level}]</level> <cyan>{message}</cyan>"
+    )
+
+    # 🧾 Salida a fichero (detallada, incluye DEBUG; sin introspección de frames por registro)
+    logger.add(
+        log_file_path,
+        level="DEBUG",
+        rotation="1 day",  # Rota cada día
+        retention="7 days",  # Mantiene logs por 7 días
+        compression="zip",  # Comprime logs antiguos
+        format="[{time:YYYY-MM-DD HH:mm:ss}] [{level}] {message}",
+        backtrace=False,
+        diagnose=False,
+        enqueue=True  # Formatea y escribe en un hilo aparte, sin bloquear el test
+    )
+
+    # 🧯 Errores con trazas completas, en un fichero aparte (solo aquí se paga el diagnóstico)
+    logger.add(
+        _ruta_errores(log_file_path),
+        level="ERROR",
+        retention="7 days",
+        delay=True,  # El fichero solo se crea si llega a registrarse algún error
+        format="[{time:YYYY-MM-DD HH:mm:ss}] [{level}] {message}",
+        backtrace=True,  # Añade traceback si hay excepciones
+        diagnose=True,  # Información útil de errores complejos
+        enqueue=True
+    )
+
+    return log_file_path
 
 
 # 📤 Función auxiliar para recuperar la ruta del log actual
 def get_log_file():
-    return LOG_FILE_PATH
+    return configure()
+
+
+# 📤 Ruta del log de errores (solo existe si se registró algún ERROR)
+def get_error_log_file():
+    return _ruta_errores(configure())
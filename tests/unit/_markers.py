@@ -0,0 +1,27 @@
+# tests/unit/_markers.py
+
+import pytest
+import allure
+
+
+def micro_unit(micro, feature, story, asyncio=True):
+    """
+    Aplica de una vez las etiquetas Allure y los marks de pytest comunes
+    a los tests unitarios de un micro.
+    """
+    marks = [
+        allure.tag(f"micro:{micro}", "tipo:unitario"),
+        allure.feature(feature),
+        allure.story(story),
+        pytest.mark.unit,
+        getattr(pytest.mark, f"micro_{micro}"),
+    ]
+    if asyncio:
+        marks.append(pytest.mark.asyncio)
+
+    def decorador(fn):
+        for mark in reversed(marks):
+            fn = mark(fn)
+        return fn
+
+    return decorador
@@ -1,15 +1,9 @@
 # tests/unit/test_consultas_unit.py
 
-import pytest
-import allure
+from _markers import micro_unit
 from mock_agent_ai.micro_consultas.main import responder, Pregunta
 
-@allure.tag("micro:consultas", "tipo:unitario")
-@allure.feature("Microservicio Consultas")
-@allure.story("Respuesta de saldo")
-@pytest.mark.unit
-@pytest.mark.micro_consultas
-@pytest.mark.asyncio
+@micro_unit("consultas", "Microservicio Consultas", "Respuesta de saldo")
 async def test_responder_saldo():
     """Si la pregunta contiene 'saldo', devuelve el saldo correcto."""
     pregunta = Pregunta(pregunta="¿Cuál es mi saldo actual?")
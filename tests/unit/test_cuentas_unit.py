@@ -1,15 +1,9 @@
 # tests/unit/test_cuentas_unit.py
 
-import pytest
-import allure
+from _markers import micro_unit
 from mock_agent_ai.micro_cuentas.main import responder, Pregunta
 
-@allure.tag("micro:cuentas", "tipo:unitario")
-@allure.feature("Microservicio Cuentas")
-@allure.story("Apertura de cuenta")
-@pytest.mark.unit
-@pytest.mark.micro_cuentas
-@pytest.mark.asyncio
+@micro_unit("cuentas", "Microservicio Cuentas", "Apertura de cuenta")
 async def test_responder_abrir_cuenta():
     """Si la pregunta contiene 'abrir cuenta', devuelve confirmación de apertura."""
     pregunta = Pregunta(pregunta="Quiero abrir cuenta")
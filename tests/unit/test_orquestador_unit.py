@@ -1,21 +1,76 @@
 # tests/unit/test_orquestador_unit.py
 
+import httpx
 import pytest
-import allure
-from fastapi.testclient import TestClient
-from mock_agent_ai.orquestador.main import app, VALID_TOKEN
-
-client = TestClient(app)
-
-@allure.tag("micro:orquestador", "tipo:unitario")
-@allure.feature("Microservicio Orquestador")
-@allure.story("Obtener token")
-@pytest.mark.unit
-@pytest.mark.micro_orquestador
-def test_obtener_token():
+from _markers import micro_unit
+from mock_agent_ai.orquestador import main
+from mock_agent_ai.orquestador.main import VALID_TOKEN
+
+# Endpoints ficticios: el host identifica a qué micro se ha reenviado la pregunta
+MICROS_SIMULADOS = ["http://consultas", "http://cuentas", "http://identidad", "http://ia"]
+
+
+@pytest.fixture
+def peticiones_reenviadas(client, monkeypatch):
+    """
+    Sustituye el cliente HTTP compartido del orquestador por uno con MockTransport
+    y devuelve la lista donde se van guardando las peticiones reenviadas a los micros.
+    """
+    peticiones = []
+
+    def responder(request):
+        peticiones.append(request)
+        return httpx.Response(200, json={"respuesta": f"Respuesta de {request.url.host}"})
+
+    monkeypatch.setattr(main, "MICROS", MICROS_SIMULADOS)
+    monkeypatch.setattr(main.app.state, "http_client", httpx.AsyncClient(
+        headers={"Authorization": main.AUTH_ESPERADA},
+        transport=httpx.MockTransport(responder),
+    ))
+    return peticiones
+
+
+@micro_unit("orquestador", "Microservicio Orquestador", "Obtener token", asyncio=False)
+def test_obtener_token(client):
     """Comprueba que POST /token devuelve un access_token válido."""
     resp = client.post("/token")
     assert resp.status_code == 200
     body = resp.json()
     assert "access_token" in body
     assert body["access_token"] == VALID_TOKEN
+
+
+@micro_unit("orquestador", "Microservicio Orquestador", "Enrutado de preguntas", asyncio=False)
+@pytest.mark.parametrize("pregunta, micro", [
+    ("¿Cuál es mi saldo actual?", "consultas"),
+    ("¿Qué requisitos hay para abrir cuenta?", "cuentas"),
+    ("¿Cómo verifico mi DNI?", "identidad"),
+    ("¿Cuál es el color del cielo?", "ia"),
+    # Si encajan varios micros, gana el primero en orden (consultas > cuentas > identidad)
+    ("¿Qué tipo de cuenta necesito para tener tarjeta?", "consultas"),
+])
+def test_enrutado_por_palabras_clave(client, peticiones_reenviadas, pregunta, micro):
+    """Cada pregunta se reenvía solo al micro que le corresponde por palabras clave."""
+    resp = client.post(
+        "/consulta",
+        json={"pregunta": pregunta},
+        headers={"Authorization": f"Bearer {VALID_TOKEN}"},
+    )
+    assert resp.status_code == 200
+    assert [p.url.host for p in peticiones_reenviadas] == [micro]
+
+
+@micro_unit("orquestador", "Microservicio Orquestador", "Reenvío al micro", asyncio=False)
+def test_reenvio_con_token_y_respuesta_del_micro(client, peticiones_reenviadas):
+    """El reenvío lleva el token del orquestador y devuelve la 'respuesta' del micro."""
+    resp = client.post(
+        "/consulta",
+        json={"pregunta": "¿Cuál es mi saldo actual?"},
+        headers={"Authorization": f"Bearer {VALID_TOKEN}"},
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"respuesta": "Respuesta de consultas"}
+
+    (peticion,) = peticiones_reenviadas
+    assert peticion.url.path == "/respuesta"
+    assert peticion.headers["Authorization"] == f"Bearer {VALID_TOKEN}"